@@ -1,15 +1,57 @@
-import contextlib
+import asyncio
+import copy
 import enum
-import json
-import pathlib
+import random
+import re
+import time
 import typing as t
 
 import aiohttp
-from discord import Color, Embed, Interaction, Member, TextChannel, Thread, app_commands
+import orjson
+from discord import Color, Embed, Interaction, Member, NotFound, TextChannel, Thread, User, app_commands
 from discord.ext import commands, tasks
 
 from chii.config import Config
-from chii.utils import T_CHANNEL, T_DATA, T_NUMERIC, LogSubclass, SimpleUtils
+from chii.utils import T_CHANNEL, T_DATA, LogSubclass, SimpleUtils
+
+
+# Matches the trailing number of progress values like "42" or "12 - 13".
+_PROGRESS_RE = re.compile(r"(\d+)\s*$")
+
+# Usernames change rarely. A day of staleness is acceptable.
+_USER_CACHE_TTL_SEC = float(24 * 3600)
+
+# Caps how many media entries a user's progress cache can accumulate.
+_PROGRESS_CACHE_MAX = 512
+
+_UPDATE_INTERVAL_SEC = Config.ANILIST_DEBUG_UPDATES_TIME_SEC if Config.DEBUG else Config.ANILIST_NORMAL_UPDATES_TIME_SEC
+
+# Bounds the send fan-out so a large cycle cannot burst Discord's per-route rate limit.
+_SEND_CONCURRENCY = 8
+
+_EMBED_DESC = (
+    "{progress_line}"
+    "Current Streak: **{streak}** {day_word}\n\n"
+    "[**AniList**](https://anilist.co/anime/{media_id}) | "
+    "[**MyAnimeList**](https://myanimelist.net/anime/{mal_id})\n\n"
+    "<t:{created_at}:R>"
+)
+
+# Compact single-line fragments keep the request body free of indentation bloat.
+# Query.Activity only filters by userId, so names are resolved to ids first.
+_ACTIVITY_FRAGMENT = (
+    "{alias}: Activity(userId: $id_{i}, sort: ID_DESC) {{ ... on ListActivity {{ id createdAt progress status "
+    "media {{ id idMal title {{ romaji }} }} user {{ id name avatar {{ medium }} }} }} }}"
+)
+
+# Used once a user's AniList author fields are cached in user_data;
+# skipping the user block roughly halves the response payload.
+_ACTIVITY_FRAGMENT_LEAN = (
+    "{alias}: Activity(userId: $id_{i}, sort: ID_DESC) {{ ... on ListActivity {{ id createdAt progress status "
+    "media {{ id idMal title {{ romaji }} }} }} }}"
+)
+
+_USER_ID_FRAGMENT = "{alias}: User(name: $name_{i}) {{ id }}"
 
 
 class _Status(enum.Enum):
@@ -27,14 +69,44 @@ class _Status(enum.Enum):
 class AniListCog(LogSubclass, commands.Cog):
     group = app_commands.Group(name="anilist", description="Manage and track AniList activity for Discord users.")
 
+    _STATUS_LOOKUP: t.ClassVar = {status.value: status for status in _Status}
+
+    _STATUS_COLOR_MAP: t.ClassVar = {
+        _Status.COMPLETED: Color.green(),
+        _Status.DROPPED: Color.orange(),
+        _Status.PAUSED: Color.red(),
+    }
+
     def __init__(self: t.Self, bot: commands.Bot) -> None:
         self.bot = bot
-        self.session = aiohttp.ClientSession()
+        self.session: aiohttp.ClientSession | None = None
+
+        self._data = self._load_data()
+        self._dirty = False
+        self._rate_remaining: int | None = None
+        self._user_cache: dict[int, tuple[User, float]] = {}
+        self._save_lock = asyncio.Lock()
+        self._query_cache: tuple[frozenset[tuple[str, str]], str, T_DATA, T_DATA] | None = None
+        self._channel: T_CHANNEL = None
 
-        self.log.info("Starting AniListCog background update task...")
-        self.normal_updates.start()
         self.log.info("AniListCog initialized.")
 
+    async def cog_load(self) -> None:
+        # Building the session here guarantees it binds to the bot's running loop.
+        self.session = aiohttp.ClientSession(
+            base_url="https://graphql.anilist.co",
+            connector=aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60),
+            # Accept-Encoding is left to aiohttp: it advertises gzip/deflate
+            # itself and only adds br when a Brotli decoder is installed.
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+
+        self.log.info("Starting AniListCog background update task...")
+        self.update_loop.start()
+        self.flush_loop.start()
+        self.log.info("AniListCog loaded.")
+
     def _load_data(self) -> T_DATA:
         default_data = {
             "channel_id": None,
@@ -51,33 +123,58 @@ class AniListCog(LogSubclass, commands.Cog):
 
         self.log.debug(f'Loading AniList data from "{Config.ANILIST_DATA_PATH}"...')
 
-        with pathlib.Path(Config.ANILIST_DATA_PATH).open(encoding="utf-8") as f:
-            return json.load(f)
+        data = orjson.loads(Config.ANILIST_DATA_PATH.read_bytes())
 
-    async def cog_unload(self) -> None:
-        self.log.info("Unloading AniListCog and stopping background tasks...")
+        # JSON stores keys as strings. The cache is keyed by media ID internally.
+        for user_data in data.get("users", {}).values():
+            cache = user_data.get("progress_cache")
 
-        self.normal_updates.cancel()
+            if cache:
+                user_data["progress_cache"] = {int(k): v for k, v in cache.items()}
 
-        if self.debug_updates.is_running():
-            self.log.info("Stopping debug update task...")
-            self.debug_updates.cancel()
+        return data
 
-        await self.session.close()
-        self.log.info("Closed AIOHTTP session.")
+    async def _flush(self) -> None:
+        if not self._dirty:
+            self.log.debug("AniList data is clean. Skipping flush...")
+            return
 
-    @tasks.loop(seconds=Config.ANILIST_NORMAL_UPDATES_TIME_SEC)
-    async def normal_updates(self) -> None:
-        self.log.debug("Normal update loop triggered.")
+        async with self._save_lock:
+            # Cleared before the write so a mutation landing mid-write keeps
+            # its flag for the next flush instead of being wiped.
+            self._dirty = False
 
-        await self.bot.wait_until_ready()
-        await self.run_update_cycle()
+            # The worker thread serializes while the event loop keeps
+            # mutating; hand it a snapshot, never the live dict.
+            snapshot = copy.deepcopy(self._data)
+            await SimpleUtils.asave_data(Config.ANILIST_DATA_PATH, snapshot)
+
+        self.log.debug("Flushed AniList data to disk.")
+
+    @tasks.loop(seconds=5)
+    async def flush_loop(self) -> None:
+        # Coalesces bursts of mutations into a single disk write.
+        await self._flush()
+
+    async def cog_unload(self) -> None:
+        self.log.info("Unloading AniListCog and stopping background tasks...")
+
+        self.update_loop.cancel()
+        self.flush_loop.cancel()
+        await self._flush()
+
+        if self.session:
+            await self.session.close()
+            self.log.info("Closed AIOHTTP session.")
 
-    @tasks.loop(seconds=Config.ANILIST_DEBUG_UPDATES_TIME_SEC)
-    async def debug_updates(self) -> None:
-        self.log.debug("Debug update loop triggered.")
+    @tasks.loop(seconds=_UPDATE_INTERVAL_SEC)
+    async def update_loop(self) -> None:
+        self.log.debug("Update loop triggered.")
 
         await self.bot.wait_until_ready()
+
+        # Desynchronizes us from other bots polling AniList on the same cadence.
+        await asyncio.sleep(random.uniform(0, _UPDATE_INTERVAL_SEC * 0.1))
         await self.run_update_cycle()
 
     @group.command(name="force", description="Manually force an AniList update check for all linked users.")
@@ -86,7 +183,7 @@ class AniListCog(LogSubclass, commands.Cog):
         self.log.info("Manual AniList update forced by owner.")
 
         await interaction.response.defer(ephemeral=True)
-        await self.run_update_cycle()
+        await self.run_update_cycle(force=True)
         await interaction.followup.send("Manual update executed.", ephemeral=True)
 
     @group.command(name="channel", description="Set the channel where AniList activity updates will be posted.")
@@ -95,11 +192,11 @@ class AniListCog(LogSubclass, commands.Cog):
     async def anilist_channel(self: t.Self, interaction: Interaction, channel: TextChannel) -> None:
         self.log.info(f"Setting AniList notification channel to {channel.id}...")
 
-        data = self._load_data()
-        data["channel_id"] = channel.id
+        self._data["channel_id"] = channel.id
+        self._channel = channel
+        self._dirty = True
 
-        SimpleUtils.save_data(Config.ANILIST_DATA_PATH, data)
-        self.log.info(f"AniList notification channel set to {channel.id} and saved.")
+        self.log.info(f"AniList notification channel set to {channel.id}. Flush pending.")
 
         await interaction.response.send_message(f"Set {channel.mention} as AniList notification channel.", ephemeral=True)
 
@@ -111,8 +208,7 @@ class AniListCog(LogSubclass, commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
 
-        data = self._load_data()
-        data["users"][str(member.id)] = {
+        self._data["users"][str(member.id)] = {
             "anilist": username,
             "last_activity_at": None,
             "last_activity_id": None,
@@ -122,27 +218,48 @@ class AniListCog(LogSubclass, commands.Cog):
             "synced": False,
         }
 
-        SimpleUtils.save_data(Config.ANILIST_DATA_PATH, data)
-        self.log.info(f'Linked Discord user {member.id} to AniList username "{username}" and saved.')
+        self._dirty = True
+        self._query_cache = None
+
+        self.log.info(f'Linked Discord user {member.id} to AniList username "{username}". Flush pending.')
 
         await interaction.followup.send(f"Linked {member.mention} to [{username}](<https://anilist.co/user/{username}>).", ephemeral=True)
 
-    async def run_update_cycle(self) -> None:
+    async def run_update_cycle(self, force: bool = False) -> None:
         self.log.info("Starting AniList update cycle...")
 
-        data = self._load_data()
+        data = self._data
         users = data.get("users", {})
 
         if not users:
             self.log.info("No users linked for AniList tracking.")
             return
 
-        channel = self.get_notification_channel(data["channel_id"])
+        # Resolving through the Discord cache every tick is wasted work;
+        # re-resolve only when the cached channel is missing.
+        channel = self._channel or self.get_notification_channel(data["channel_id"])
 
         if not channel:
             return
 
-        batch, alias_map = await self.fetch_activity_batch(users)
+        self._channel = channel
+
+        now = time.time()
+        threshold = _UPDATE_INTERVAL_SEC * 0.9
+
+        # A forced cycle checks everyone regardless of recency; the owner
+        # asked for it explicitly.
+        eligible = users if force else {discord_id: u for discord_id, u in users.items() if now - u.get("last_checked_at", 0) > threshold}
+
+        if not eligible:
+            self.log.debug("All users were checked recently. Skipping this cycle...")
+            return
+
+        if self._rate_remaining is not None and self._rate_remaining < len(eligible):
+            self.log.warning(f"AniList rate limit budget is low ({self._rate_remaining} requests left). Waiting before querying...")
+            await asyncio.sleep(60)
+
+        batch, alias_map = await self.fetch_activity_batch(eligible)
 
         if not batch:
             self.log.warning("No activity data returned from AniList API!")
@@ -152,17 +269,52 @@ class AniListCog(LogSubclass, commands.Cog):
             self.log.warning("No alias map returned from AniList API!")
             return
 
+        # Not marked dirty on purpose: this piggybacks on the next real flush.
+        for u in eligible.values():
+            u["last_checked_at"] = now
+
+        work = []
+
         for alias, activity in batch.items():
             if not activity:
                 continue
 
             discord_id = alias_map[alias]
             user_data = users[discord_id]
+            last_seen = user_data["last_activity_id"]
 
-            if not await self.process_activity(channel, discord_id, user_data, activity):
+            if user_data["synced"] and last_seen and activity["id"] <= last_seen:
                 continue
 
-        SimpleUtils.save_data(Config.ANILIST_DATA_PATH, data)
+            # The users dict is str-keyed for JSON; Discord APIs want ints.
+            work.append((int(discord_id), user_data, activity))
+
+        if not work:
+            self.log.debug("No new activities in this batch.")
+            return
+
+        results = await asyncio.gather(
+            *(self.process_activity(discord_id, user_data, activity) for discord_id, user_data, activity in work),
+            return_exceptions=True,
+        )
+
+        to_send = []
+
+        for (discord_id, user_data, _activity), embed in zip(work, results):
+            if isinstance(embed, Exception):
+                self.log.error(f"Failed to process activity for member {discord_id} (ID): {embed}")
+                continue
+
+            if embed:
+                to_send.append((user_data, embed))
+
+        sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+        send_results = await asyncio.gather(*(self._guarded_send(sem, channel, user_data, embed) for user_data, embed in to_send), return_exceptions=True)
+
+        for result in send_results:
+            if isinstance(result, Exception):
+                self.log.error(f"Failed to send an update embed: {result}")
+
         self.log.info("AniList update cycle completed.")
 
     def get_notification_channel(self: t.Self, channel_id: int) -> T_CHANNEL:
@@ -178,148 +330,189 @@ class AniListCog(LogSubclass, commands.Cog):
 
         return channel
 
-    async def fetch_activity_batch(self: t.Self, users: T_DATA) -> tuple[T_DATA | None, T_DATA | None]:
-        active_users = {}
+    async def _resolve_user_ids(self: t.Self, users: T_DATA) -> None:
+        unresolved = {discord_id: u for discord_id, u in users.items() if "anilist_id" not in u}
+
+        if not unresolved:
+            return
+
+        self.log.info("Resolving AniList ids for %s user(s)...", len(unresolved))
+
         alias_map = {}
+        variables = {}
+        parts = []
 
-        for i, (discord_id, u) in enumerate(users.items()):
+        for i, (discord_id, u) in enumerate(unresolved.items()):
             alias = f"user_{i}"
-            active_users[alias] = u["anilist"]
             alias_map[alias] = discord_id
+            variables[f"name_{i}"] = u["anilist"]
+            parts.append(_USER_ID_FRAGMENT.format(alias=alias, i=i))
+
+        declarations = ", ".join(f"${name}: String" for name in variables)
+        query = f"query ({declarations}) {{ {' '.join(parts)} }}"
+
+        batch = await self.query_graphql(query, variables)
+
+        if not batch:
+            self.log.warning("AniList id resolution returned no data!")
+            return
+
+        for alias, resolved in batch.items():
+            discord_id = alias_map[alias]
 
-        self.log.debug(f'Fetching batch activity for users: "{active_users}"...')
+            if not resolved:
+                self.log.warning('Could not resolve an AniList id for username "%s"!', users[discord_id]["anilist"])
+                continue
 
-        user_parts = []
+            users[discord_id]["anilist_id"] = resolved["id"]
+            self._dirty = True
 
-        for alias, name in active_users.items():
-            user_parts.append(f"""
-                {alias}: User(name: "{name}") {{
-                    id
-                    name
-                }}
-            """)
+    async def fetch_activity_batch(self: t.Self, users: T_DATA) -> tuple[T_DATA | None, T_DATA | None]:
+        # Activity only filters by userId; resolve names once, persist the
+        # id, and every later cycle stays a single request.
+        await self._resolve_user_ids(users)
 
-        query = f"query {{ {' '.join(user_parts)} }}"
-        users_data = await self.query_graphql(query)
+        resolved_users = {discord_id: u for discord_id, u in users.items() if "anilist_id" in u}
 
-        if not users_data:
-            self.log.warning("No user data returned from AniList API for batch activity!")
+        if not resolved_users:
+            self.log.warning("No users with a resolved AniList id to query!")
             return None, None
 
-        id_map = {alias: payload["id"] for alias, payload in users_data.items() if payload}
+        key = frozenset((discord_id, u["anilist_id"], "anilist_user" in u) for discord_id, u in resolved_users.items())
 
-        if not id_map:
-            self.log.warning("No valid user IDs found in AniList API response!")
-            return None, None
+        if self._query_cache and self._query_cache[0] == key:
+            _, query, variables, alias_map = self._query_cache
 
-        activity_parts = []
-
-        for alias, user_id in id_map.items():
-            activity_parts.append(f"""
-                {alias}: Activity(userId: {user_id}, sort: ID_DESC) {{
-                    ... on ListActivity {{
-                        id
-                        createdAt
-                        progress
-                        status
-
-                        media {{
-                            id
-                            idMal
-                            title {{ romaji }}
-                        }}
-
-                        user {{
-                            id
-                            name
-                            avatar {{ medium }}
-                        }}
-                    }}
-                }}
-            """)
-
-        query = f"query {{ {' '.join(activity_parts)} }}"
+        else:
+            self.log.debug("User set changed. Rebuilding activity batch query...")
+
+            alias_map = {}
+            variables = {}
+            activity_parts = []
+
+            for i, (discord_id, u) in enumerate(resolved_users.items()):
+                alias = f"user_{i}"
+                alias_map[alias] = discord_id
+                variables[f"id_{i}"] = u["anilist_id"]
+
+                fragment = _ACTIVITY_FRAGMENT_LEAN if "anilist_user" in u else _ACTIVITY_FRAGMENT
+                activity_parts.append(fragment.format(alias=alias, i=i))
+
+            declarations = ", ".join(f"${name}: Int" for name in variables)
+            query = f"query ({declarations}) {{ {' '.join(activity_parts)} }}"
+
+            self._query_cache = (key, query, variables, alias_map)
 
         self.log.debug("Querying AniList API for user activities...")
-        batch = await self.query_graphql(query)
+        batch = await self.query_graphql(query, variables)
 
         return batch, alias_map
 
     async def query_graphql(self: t.Self, query: str, variables: T_DATA | None = None) -> T_DATA | None:
-        payload = {
-            "url": "https://graphql.anilist.co",
-            "json": {
-                "query": query,
-                "variables": variables or {},
-            },
-        }
+        body = orjson.dumps({"query": query, "variables": variables or {}})
 
         if not variables:
             self.log.debug("Sending GraphQL query to AniList API with no variables.")
         else:
             self.log.debug(f'Sending GraphQL query to AniList API with variables: "{variables}"...')
 
-        try:
-            async with self.session.post(**payload) as response:
-                ok = 200
+        for attempt in range(4):
+            try:
+                async with self.session.post("/", data=body) as response:
+                    remaining = response.headers.get("X-RateLimit-Remaining")
 
-                if response.status != ok:
-                    text = await response.text()
-                    self.log.error(f"AniList API Error {response.status}: {text}")
-                    return None
+                    if remaining is not None:
+                        self._rate_remaining = int(remaining)
 
-                data = await response.json()
+                    if response.status in {429, 503}:
+                        delay = float(response.headers.get("Retry-After", "1")) * 2**attempt + random.random()
+                        self.log.warning(f"AniList API returned {response.status}. Retrying in {delay:.1f}s...")
 
-                if "errors" in data:
-                    self.log.error(f'AniList GraphQL Error: {data["errors"]}')
-                    return None
+                        await asyncio.sleep(delay)
+                        continue
 
-                self.log.info("Retrieved data from AniList.")
-                return data["data"]
+                    ok = 200
 
-        except Exception:
-            self.log.exception("AniList API Exception!")
-            return None
+                    if response.status != ok:
+                        text = await response.text()
+                        self.log.error(f"AniList API Error {response.status}: {text}")
+                        return None
 
-    async def process_activity(self: t.Self, channel: T_CHANNEL, discord_id: T_NUMERIC, user_data: T_DATA, activity: T_DATA) -> bool:
+                    data = orjson.loads(await response.read())
+
+                    if "errors" in data:
+                        self.log.error(f'AniList GraphQL Error: {data["errors"]}')
+                        return None
+
+                    self.log.info("Retrieved data from AniList.")
+                    return data["data"]
+
+            except Exception:
+                self.log.exception("AniList API Exception!")
+                return None
+
+        self.log.error("AniList API retries exhausted!")
+        return None
+
+    async def process_activity(self: t.Self, discord_id: int, user_data: T_DATA, activity: T_DATA) -> Embed | None:
         activity_id = activity["id"]
         last_seen = user_data["last_activity_id"]
 
+        self._cache_author(user_data, activity)
+
         if not user_data["synced"]:
-            self.log.info(f"Syncing user data for member {discord_id} (ID).")
+            self.log.info("Syncing user data for member %s (ID).", discord_id)
             user_data.update({"last_activity_id": activity_id, "synced": True})
+            self._dirty = True
 
-            return False
+            return None
 
-        self.log.debug(f"Activity ID: {activity_id}, Last Seen: {last_seen}")
+        self.log.debug("Activity ID: %s, Last Seen: %s", activity_id, last_seen)
 
         if last_seen and activity_id <= last_seen:
-            self.log.debug(f"No new activity for member {discord_id} (ID).")
-            return False
+            self.log.debug("No new activity for member %s (ID).", discord_id)
+            return None
 
         user_data["last_activity_id"] = activity_id
+        self._dirty = True
+
+        self._parse_activity(activity)
 
         if not self.is_real_progress(user_data, activity):
-            self.log.debug(f"Activity for {discord_id} (ID) is not real progress.")
-            return False
+            self.log.debug("Activity for %s (ID) is not real progress.", discord_id)
+            return None
 
         self.update_streak(user_data, activity["createdAt"])
 
-        embed = await self.build_embed(discord_id, user_data, activity)
-        await self.send_update(channel, user_data, embed)
+        return await self.build_embed(discord_id, user_data, activity)
 
-        return True
+    def _cache_author(self: t.Self, user_data: T_DATA, activity: T_DATA) -> None:
+        author = activity.get("user")
+
+        if not author:
+            return
+
+        cached = {"id": author["id"], "name": author["name"], "avatar_medium": author["avatar"]["medium"]}
+
+        if user_data.get("anilist_user") != cached:
+            user_data["anilist_user"] = cached
+            self._dirty = True
+
+    def _parse_activity(self: t.Self, activity: T_DATA) -> None:
+        # Parsed once here so the downstream checks and the embed share it.
+        activity["_status"] = self.extract_status(activity)
+        activity["_progress"] = self.extract_progress(activity)
 
     def is_real_progress(self: t.Self, user_data: T_DATA, activity: T_DATA) -> bool:
         if not self.is_consumption_activity(activity):
             self.log.debug("Activity is not a consumption activity. Skipping progress check...")
             return False
 
-        media_id = str(activity["media"]["id"])
-        new_progress = self.extract_progress(activity)
+        media_id = activity["media"]["id"]
+        new_progress = activity["_progress"]
 
         if not new_progress:
-            status = self.extract_status(activity)
+            status = activity["_status"]
 
             if status and status in {_Status.COMPLETED, _Status.DROPPED, _Status.PAUSED}:
                 self.log.info("Activity has no numeric progress but it is supported.")
@@ -329,117 +522,151 @@ class AniListCog(LogSubclass, commands.Cog):
             return False
 
         cache = user_data.setdefault("progress_cache", {})
-        old_progress = cache.get(media_id)
+
+        # Pop + reinsert keeps the dict in least-recently-touched order.
+        old_progress = cache.pop(media_id, None)
         cache[media_id] = new_progress
 
+        if len(cache) > _PROGRESS_CACHE_MAX:
+            evicted = next(iter(cache))
+            del cache[evicted]
+            self.log.debug("Progress cache full. Evicted media %s (ID).", evicted)
+
         if not old_progress:
-            self.log.info(f"Initial cache set for media {media_id}.")
+            self.log.info("Initial cache set for media %s.", media_id)
             return True
 
         if new_progress > old_progress:
-            self.log.info(f"Progress of media {media_id} (ID) increased from {old_progress} to {new_progress}.")
+            self.log.info("Progress of media %s (ID) increased from %s to %s.", media_id, old_progress, new_progress)
             return True
 
-        self.log.debug(f"No progress increase for media {media_id} (ID). Current: {new_progress}, Previous: {old_progress}.")
+        self.log.debug("No progress increase for media %s (ID). Current: %s, Previous: %s.", media_id, new_progress, old_progress)
         return False
 
     def update_streak(self: t.Self, user_data: T_DATA, timestamp: int) -> None:
         last = user_data["last_activity_at"]
+        new_day = timestamp // 86400
 
         if not last:
-            user_data["streak"] = 1
+            new_streak = 1
             self.log.info("New streak started for user.")
 
         else:
-            last_day = last // 86400
-            new_day = timestamp // 86400
+            last_day = user_data.get("last_activity_day") or last // 86400
 
             if new_day == last_day:
                 self.log.debug("Activity occurred on the same day. Streak is not changed.")
                 return
 
             if new_day - last_day == 1:
-                user_data["streak"] += 1
-                self.log.info(f'Streak incremented to {user_data["streak"]}.')
+                new_streak = user_data["streak"] + 1
+                self.log.info("Streak incremented to %s.", new_streak)
 
             else:
-                user_data["streak"] = 1
+                new_streak = 1
                 self.log.info("Streak reset to 1.")
 
-        user_data["last_activity_at"] = timestamp
-        self.log.debug(f'Updated "last_activity_at" to {timestamp}.')
+        user_data.update({"streak": new_streak, "last_activity_at": timestamp, "last_activity_day": new_day})
+        self.log.debug('Updated "last_activity_at" to %s.', timestamp)
 
-    async def build_embed(self: t.Self, discord_id: T_NUMERIC, user_data: T_DATA, activity: T_DATA) -> Embed:
-        title = activity["media"]["title"]["romaji"]
-        status = self.extract_status(activity)
-        progress = None
+    async def _get_user(self: t.Self, discord_id: int) -> User | None:
+        cached = self._user_cache.get(discord_id)
 
-        status_color_map = {
-            _Status.COMPLETED: Color.green(),
-            _Status.DROPPED: Color.orange(),
-            _Status.PAUSED: Color.red(),
-        }
+        if cached and time.monotonic() - cached[1] < _USER_CACHE_TTL_SEC:
+            return cached[0]
+
+        user = self.bot.get_user(discord_id)
+
+        if not user:
+            self.log.debug("User %s (ID) not cached. Fetching from Discord...", discord_id)
+            user = await self.bot.fetch_user(discord_id)
+
+        self._user_cache[discord_id] = (user, time.monotonic())
 
-        if status in status_color_map:
+        return user
+
+    async def build_embed(self: t.Self, discord_id: int, user_data: T_DATA, activity: T_DATA) -> Embed:
+        media = activity["media"]
+        author = user_data["anilist_user"]
+        streak = user_data["streak"]
+        day_word = "day" if streak == 1 else "days"
+
+        title = media["title"]["romaji"]
+        status = activity["_status"]
+        progress = None
+
+        if status in self._STATUS_COLOR_MAP:
             title = f"{status.value} {title}"
-            color = status_color_map[status]
+            color = self._STATUS_COLOR_MAP[status]
         else:
-            progress = self.extract_progress(activity)
+            progress = activity["_progress"]
             color = Color.ash_theme()
 
-        parts = [
-            f'{(status.value if status else "Unknown")}: **{progress}**\n' if progress else None,
-            f'Current Streak: **{user_data["streak"]}** {"day" if user_data["streak"] == 1 else 'days'}\n\n',
-            f'[**AniList**](https://anilist.co/anime/{activity["media"]["id"]}) | ',
-            f'[**MyAnimeList**](https://myanimelist.net/anime/{activity["media"]["idMal"]})\n\n',
-            f'<t:{activity["createdAt"]}:R>',
-        ]
+        progress_line = f'{(status.value if status else "Unknown")}: **{progress}**\n' if progress else ""
+        description = _EMBED_DESC.format(
+            progress_line=progress_line,
+            streak=streak,
+            day_word=day_word,
+            media_id=media["id"],
+            mal_id=media["idMal"],
+            created_at=activity["createdAt"],
+        )
 
-        embed = Embed(color=color, title=title, description="".join(p for p in parts if p))
+        embed = Embed(color=color, title=title, description=description)
 
-        user = await self.bot.fetch_user(int(discord_id))
+        user = await self._get_user(discord_id)
 
-        author_name = f'{activity["user"]["name"]} (@{user.name})' if user else activity["user"]["name"]
-        author_url = f'https://anilist.co/user/{activity["user"]["id"]}'
-        author_icon = activity["user"]["avatar"]["medium"]
+        author_name = f'{author["name"]} (@{user.name})' if user else author["name"]
+        author_url = f'https://anilist.co/user/{author["id"]}'
+        author_icon = author["avatar_medium"]
 
         embed.set_author(name=author_name, url=author_url, icon_url=author_icon)
 
         return embed
 
-    async def send_update(self: t.Self, channel: T_CHANNEL, user_data: T_DATA, embed: Embed) -> None:
-        old_message_id = user_data["last_message_id"]
+    async def _guarded_send(self: t.Self, sem: asyncio.Semaphore, channel: T_CHANNEL, user_data: T_DATA, embed: Embed) -> None:
+        async with sem:
+            await self.send_update(channel, user_data, embed)
 
+    async def send_update(self: t.Self, channel: T_CHANNEL, user_data: T_DATA, embed: Embed) -> None:
         if not channel or not SimpleUtils.is_messageable(channel):
             self.log.warning("An invalid channel was supplied!")
             return
 
-        if old_message_id:
-            with contextlib.suppress(Exception):
-                if isinstance(channel, (TextChannel, Thread)):
-                    await channel.get_partial_message(old_message_id).delete()
+        old_message_id = user_data["last_message_id"]
+
+        # Editing the previous update is one REST call instead of the
+        # delete+send pair, and keeps the channel history quiet.
+        if old_message_id and isinstance(channel, (TextChannel, Thread)):
+            try:
+                await channel.get_partial_message(old_message_id).edit(embed=embed)
+                return
+
+            except NotFound:
+                self.log.debug("Previous update message %s (ID) is gone. Sending a new one...", old_message_id)
 
         message = await channel.send(embed=embed)
         user_data["last_message_id"] = message.id
+        self._dirty = True
 
     def is_consumption_activity(self: t.Self, activity: T_DATA) -> bool:
-        status = self.extract_status(activity)
+        status = activity["_status"]
 
         if not status:
             self.log.info("Ignoring non-consumption activity.")
             return False
 
-        self.log.debug(f'Activity "{status}" is a valid consumption activity.')
+        self.log.debug('Activity "%s" is a valid consumption activity.', status)
         return True
 
     def extract_status(self: t.Self, activity: T_DATA) -> _Status | None:
         status = activity.get("status", "_").split()[0].capitalize()
+        member = self._STATUS_LOOKUP.get(status)
 
-        try:
-            return _Status(status)
-        except ValueError:
-            self.log.warning(f'Unsupported status "{status}" found!')
-            return None
+        if member is None:
+            self.log.warning('Unsupported status "%s" found!', status)
+
+        return member
 
     def extract_progress(self: t.Self, activity: T_DATA) -> int | None:
         raw = activity["progress"]
@@ -448,21 +675,16 @@ class AniListCog(LogSubclass, commands.Cog):
             self.log.debug("No progress field found in activity.")
             return None
 
-        try:
-            text = str(raw).strip()
-
-            if "-" in text:
-                text = text.split("-")[-1].strip()
+        match = _PROGRESS_RE.search(str(raw))
 
-            progress = int(text)
-            self.log.debug(f"Extracted progress value of {progress}.")
-
-        except (ValueError, TypeError):
-            self.log.warning(f'Failed to extract numeric progress from raw value "{raw}"!')
+        if not match:
+            self.log.warning('Failed to extract numeric progress from raw value "%s"!', raw)
             return None
 
-        else:
-            return progress
+        progress = int(match.group(1))
+        self.log.debug("Extracted progress value of %s.", progress)
+
+        return progress
 
 
 async def setup(bot: commands.Bot) -> None:
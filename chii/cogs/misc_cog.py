@@ -1,3 +1,5 @@
+import asyncio
+import pathlib
 import typing as t
 
 from discord import Activity, ActivityType, Interaction, app_commands
@@ -7,6 +9,14 @@ from chii.config import Config
 from chii.utils import DumpViewer, LogSubclass, SimpleUtils
 
 
+_ACTIVITIES = {
+    "playing": lambda text: Activity(type=ActivityType.playing, name=text),
+    "watching": lambda text: Activity(type=ActivityType.watching, name=text),
+    "listening": lambda text: Activity(type=ActivityType.listening, name=text),
+    "streaming": lambda text: Activity(type=ActivityType.streaming, name=text, url="https://twitch.tv/motxi"),
+}
+
+
 class MiscCog(LogSubclass, commands.Cog):
     group = app_commands.Group(name="misc", description="Miscellaneous utility commands.")
 
@@ -32,21 +42,13 @@ class MiscCog(LogSubclass, commands.Cog):
             return
 
         try:
-            with safe_path.open(encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-
-            if reverse:
-                lines.reverse()
-
-            text = "".join(lines)
+            pages = await asyncio.to_thread(self._read_pages, safe_path, reverse)
 
         except Exception:
             self.log.exception("Failed while reading dump file!")
             await interaction.response.send_message("Failed to read file. See logs for more info.", ephemeral=True)
             return
 
-        pages = SimpleUtils.paginate_text(text)
-
         if not pages:
             await interaction.response.send_message("File is empty.", ephemeral=True)
             return
@@ -55,6 +57,16 @@ class MiscCog(LogSubclass, commands.Cog):
 
         await interaction.response.send_message(content=view.get_content(), view=view)
 
+    @staticmethod
+    def _read_pages(path: pathlib.Path, reverse: bool) -> list[str]:
+        # Runs in a worker thread so multi-MB files never block the event loop.
+        text = path.read_text(encoding="utf-8", errors="ignore")
+
+        if reverse:
+            text = "".join(reversed(text.splitlines(keepends=True)))
+
+        return SimpleUtils.paginate_text(text)
+
     @group.command(name="activity", description="Change the bot's activity")
     @app_commands.describe(activity_type="Type of activity (playing, watching, listening, streaming).", text="The activity status.")
     async def misc_activity(self: t.Self, interaction: Interaction, activity_type: str, text: str) -> None:
@@ -63,19 +75,13 @@ class MiscCog(LogSubclass, commands.Cog):
             return
 
         activity_type = activity_type.lower()
+        build = _ACTIVITIES.get(activity_type)
+
+        if build is None:
+            await interaction.response.send_message("Invalid activity type.", ephemeral=True)
+            return
 
-        match activity_type:
-            case "playing":
-                activity = Activity(type=ActivityType.playing, name=text)
-            case "watching":
-                activity = Activity(type=ActivityType.playing, name=text)
-            case "listening":
-                activity = Activity(type=ActivityType.listening, name=text)
-            case "streaming":
-                activity = Activity(type=ActivityType.streaming, name=text, url="https://twitch.tv/motxi")
-            case _:
-                await interaction.response.send_message("Invalid activity type.", ephemeral=True)
-                return
+        activity = build(text)
 
         await self.bot.change_presence(activity=activity)
         await interaction.response.send_message(f"Status changed to: {activity_type.title()} **{text}**.")
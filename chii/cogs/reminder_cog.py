@@ -1,15 +1,17 @@
 import asyncio
-import json
-import pathlib
+import contextlib
+import heapq
 import time
 import typing as t
 import uuid
 
+import orjson
+
 from discord import Interaction, app_commands
 from discord.ext import commands
 
 from chii.config import Config
-from chii.utils import T_DATA, T_NUMERIC, LogSubclass, SimpleUtils
+from chii.utils import T_DATA, LogSubclass, SimpleUtils
 
 
 class ReminderCog(LogSubclass, commands.Cog):
@@ -18,7 +20,20 @@ class ReminderCog(LogSubclass, commands.Cog):
     def __init__(self: t.Self, bot: commands.Bot) -> None:
         self.bot = bot
         self.reminders = {}
-        self.tasks = {}
+        self._by_user: dict[int, set[str]] = {}
+
+        # A single scheduler task consumes this heap of (trigger, uuid) pairs.
+        # Cancelled reminders are tombstoned and skipped on pop instead of
+        # being removed from the middle of the heap.
+        self._queue: list[tuple[float, str]] = []
+        self._tombstones: set[str] = set()
+        self._wake = asyncio.Event()
+        self._scheduler_task: asyncio.Task | None = None
+
+        # Mutations set this event; a writer task coalesces bursts into a
+        # single off-loop disk write shortly after.
+        self._dirty = asyncio.Event()
+        self._writer_task: asyncio.Task | None = None
 
         self.log.info("Starting ReminderCog scheduler initialization...")
         self.bot.loop.create_task(self._initialize_scheduler())
@@ -33,11 +48,11 @@ class ReminderCog(LogSubclass, commands.Cog):
         self.log.debug(f'Loading reminders from "{Config.REMINDERS_DATA_PATH}"...')
 
         try:
-            with pathlib.Path(Config.REMINDERS_DATA_PATH).open(encoding="utf-8") as f:
-                data = json.load(f)
+            data = orjson.loads(Config.REMINDERS_DATA_PATH.read_bytes())
 
             for r in data:
                 self.reminders[r["uuid"]] = r
+                self._by_user.setdefault(r["user_id"], set()).add(r["uuid"])
 
             self.log.info(f"Loaded {len(self.reminders)} reminders from disk.")
 
@@ -45,22 +60,26 @@ class ReminderCog(LogSubclass, commands.Cog):
             self.log.exception("Failed loading reminders!")
 
     async def cog_unload(self) -> None:
-        self.log.info("Unloading ReminderCog and cancelling all reminder tasks...")
+        self.log.info("Unloading ReminderCog and stopping the scheduler...")
+
+        if self._scheduler_task:
+            self._scheduler_task.cancel()
 
-        for task in self.tasks.values():
-            task.cancel()
+        if self._writer_task:
+            self._writer_task.cancel()
 
-        self.tasks.clear()
-        self.log.info("All reminder tasks have been cancelled.")
+        if self._dirty.is_set():
+            await SimpleUtils.asave_data(Config.REMINDERS_DATA_PATH, list(self.reminders.values()))
+            self.log.info("Flushed pending reminder changes to disk.")
+
+        self.log.info("Reminder scheduler task has been cancelled.")
 
     @group.command(name="set", description="Create a new reminder that will notify you after a specified time.")
     @app_commands.describe(time_input="The time after which the reminder should trigger (e.g.: 10s, 5m, 1h, 3d).", message="Custom message. (Optional)")
     async def reminder_set(self: t.Self, interaction: Interaction, time_input: str, message: str | None) -> None:
         self.log.info(f"Received reminder set command from user {interaction.user.id}.")
 
-        user_reminders = [r for r in self.reminders.values() if r["user_id"] == interaction.user.id]
-
-        if len(user_reminders) >= Config.REMINDERS_MAX_COUNT:
+        if len(self._by_user.get(interaction.user.id, ())) >= Config.REMINDERS_MAX_COUNT:
             await interaction.response.send_message(
                 f"You have reached the maximum reminder limit ({Config.REMINDERS_MAX_COUNT}). Please delete one before creating a new reminder.",
                 ephemeral=True,
@@ -91,7 +110,7 @@ class ReminderCog(LogSubclass, commands.Cog):
             return
 
         trigger = int(time.time() + seconds)
-        reminder_uuid = str(uuid.uuid4())[:8]
+        reminder_uuid = uuid.uuid4().hex[:8]
         reminder = {
             "uuid": reminder_uuid,
             "user_id": interaction.user.id,
@@ -102,12 +121,11 @@ class ReminderCog(LogSubclass, commands.Cog):
         }
 
         self.reminders[reminder_uuid] = reminder
+        self._by_user.setdefault(interaction.user.id, set()).add(reminder_uuid)
         self.log.info(f"Created reminder {reminder_uuid} (ID) for user {interaction.user.id} (ID).")
 
-        SimpleUtils.save_data(Config.REMINDERS_DATA_PATH, list(self.reminders.values()))
-        self.log.info(f"Reminders data saved after creating reminder {reminder_uuid} (ID).")
-
-        await self._schedule_reminder(reminder)
+        self._dirty.set()
+        self._schedule_reminder(reminder)
 
         await interaction.response.send_message(content=f"I will remind you **<t:{trigger}:R>**.", ephemeral=True)
 
@@ -115,18 +133,18 @@ class ReminderCog(LogSubclass, commands.Cog):
     async def reminder_list(self: t.Self, interaction: Interaction) -> None:
         self.log.info(f"Received reminder list command from user {interaction.user.id}.")
 
-        user_reminders = [r for r in self.reminders.values() if r["user_id"] == interaction.user.id]
+        user_reminders = [self.reminders[rid] for rid in self._by_user.get(interaction.user.id, ())]
 
         if not user_reminders:
             self.log.info(f"User {interaction.user.id} has no reminders.")
             await interaction.response.send_message(content="You have no reminders.", ephemeral=True)
             return
 
-        lines = [f'- **{r["uuid"]}** <t:{int(r["trigger"])}:R> "{r["message"]}"' for r in user_reminders]
+        body = "\n".join(f'- **{r["uuid"]}** <t:{int(r["trigger"])}:R> "{r["message"]}"' for r in user_reminders)
         footer = f"\n\n-# **Total**: {len(user_reminders)}/{Config.REMINDERS_MAX_COUNT}"
 
         self.log.debug(f"Listing {len(user_reminders)} reminders for user {interaction.user.id}.")
-        await interaction.response.send_message("\n".join(lines) + footer, ephemeral=True)
+        await interaction.response.send_message(body + footer, ephemeral=True)
 
     @group.command(name="cancel", description="Cancel an existing reminder.")
     @app_commands.describe(reminder_uuid="The UUID of the reminder you want to cancel.")
@@ -140,18 +158,14 @@ class ReminderCog(LogSubclass, commands.Cog):
             await interaction.response.send_message("Reminder not found.", ephemeral=True)
             return
 
-        task = self.tasks.pop(reminder_uuid, None)
-
-        if task:
-            self.log.debug(f"Cancelling task for reminder {reminder_uuid} (ID).")
-            task.cancel()
+        self._tombstones.add(reminder_uuid)
+        self._wake.set()
 
         self.reminders.pop(reminder_uuid, None)
+        self._by_user.get(interaction.user.id, set()).discard(reminder_uuid)
+        self._dirty.set()
         self.log.info(f"Reminder {reminder_uuid} (ID) cancelled and removed.")
 
-        SimpleUtils.save_data(Config.REMINDERS_DATA_PATH, list(self.reminders.values()))
-        self.log.info(f"Reminders data saved after cancelling reminder {reminder_uuid} (ID).")
-
         await interaction.response.send_message("Reminder cancelled.", ephemeral=True)
 
     @group.command(name="edit", description="Edit the message of an existing reminder.")
@@ -159,7 +173,7 @@ class ReminderCog(LogSubclass, commands.Cog):
     async def reminder_edit(self: t.Self, interaction: Interaction, reminder_uuid: str, new_message: str) -> None:
         self.log.info(f"Received reminder edit command for reminder {reminder_uuid} (ID) from user {interaction.user.id} (ID).")
 
-        reminder = self.reminders[reminder_uuid]
+        reminder = self.reminders.get(reminder_uuid)
 
         if not reminder or reminder["user_id"] != interaction.user.id:
             self.log.warning(f"Reminder {reminder_uuid} (ID) not found or not owned by user {interaction.user.id} (ID)!")
@@ -172,11 +186,9 @@ class ReminderCog(LogSubclass, commands.Cog):
             return
 
         reminder["message"] = new_message
+        self._dirty.set()
         self.log.info(f"Reminder {reminder_uuid} (ID) message updated by user {interaction.user.id} (ID).")
 
-        SimpleUtils.save_data(Config.REMINDERS_DATA_PATH, list(self.reminders.values()))
-        self.log.info(f"Reminders data saved after editing reminder {reminder_uuid} (ID).")
-
         await interaction.response.send_message("Reminder updated.", ephemeral=True)
 
     async def _initialize_scheduler(self) -> None:
@@ -188,35 +200,82 @@ class ReminderCog(LogSubclass, commands.Cog):
 
         for reminder in self.reminders.values():
             self.log.debug(f"Scheduling reminder {reminder['uuid']} from disk...")
-            await self._schedule_reminder(reminder)
+            self._schedule_reminder(reminder)
 
+        self._scheduler_task = asyncio.create_task(self._run_scheduler())
+        self._writer_task = asyncio.create_task(self._run_writer())
         self.log.info("Reminder scheduler ready.")
 
-    async def _schedule_reminder(self: t.Self, reminder: T_DATA) -> None:
-        reminder_uuid = reminder["uuid"]
+    async def _run_writer(self) -> None:
+        self.log.info("Reminder writer loop started.")
 
-        if reminder_uuid in self.tasks:
-            self.log.debug(f"Cancelling existing task for reminder {reminder_uuid} (ID)...")
-            self.tasks[reminder_uuid].cancel()
+        while True:
+            await self._dirty.wait()
 
-        self.log.info(f"Scheduling reminder task for reminder {reminder_uuid} (ID)...")
-        task = asyncio.create_task(self._worker_task(reminder_uuid))
-        self.tasks[reminder_uuid] = task
+            # Lets a burst of mutations settle before the write.
+            await asyncio.sleep(0.5)
+            self._dirty.clear()
 
-    async def _worker_task(self: t.Self, reminder_uuid: str) -> None:
-        self.log.info(f"Reminder worker started for reminder {reminder_uuid} (ID).")
+            await SimpleUtils.asave_data(Config.REMINDERS_DATA_PATH, list(self.reminders.values()))
+            self.log.debug("Flushed reminders to disk.")
 
-        reminder = self.reminders[reminder_uuid]
+    def _schedule_reminder(self: t.Self, reminder: T_DATA) -> None:
+        self.log.info(f"Scheduling reminder {reminder['uuid']} (ID)...")
 
-        if not reminder:
-            self.log.warning(f"Reminder {reminder_uuid} (ID) not found! Stopping worker...")
-            return
+        # The heap is keyed on the monotonic clock so NTP adjustments to
+        # wall time cannot fire reminders early or stall them.
+        deadline = self.bot.loop.time() + max(0.0, reminder["trigger"] - time.time())
+
+        heapq.heappush(self._queue, (deadline, reminder["uuid"]))
+        self._wake.set()
 
-        delay = int(reminder["trigger"] - time.time())
+    async def _run_scheduler(self) -> None:
+        self.log.info("Reminder scheduler loop started.")
 
-        if delay > 0:
-            self.log.debug(f"Sleeping for {delay} seconds before triggering reminder {reminder_uuid} (ID)...")
-            await asyncio.sleep(delay)
+        while True:
+            if not self._queue:
+                await self._wake.wait()
+                self._wake.clear()
+                continue
+
+            deadline, reminder_uuid = self._queue[0]
+            reminder = self.reminders.get(reminder_uuid)
+
+            # The heap deadline only orders the queue; the actual delay is
+            # re-derived from the wall-clock trigger on every wakeup so
+            # NTP steps or a host suspend (which pauses the monotonic
+            # clock) cannot skew long reminders away from the <t:trigger:R>
+            # time promised to the user.
+            delay = reminder["trigger"] - time.time() if reminder else deadline - self.bot.loop.time()
+
+            if delay > 0:
+                # A new earlier reminder or a cancellation sets the wake
+                # event, so re-evaluate the heap instead of firing. The
+                # wait is capped so multi-day reminders re-anchor hourly
+                # instead of trusting one giant sleep.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=min(delay, 3600.0))
+                    self._wake.clear()
+
+                continue
+
+            heapq.heappop(self._queue)
+
+            if reminder_uuid in self._tombstones:
+                self._tombstones.discard(reminder_uuid)
+                self.log.debug(f"Skipping cancelled reminder {reminder_uuid} (ID).")
+                continue
+
+            await self._fire_reminder(reminder_uuid)
+
+    async def _fire_reminder(self: t.Self, reminder_uuid: str) -> None:
+        self.log.info(f"Firing reminder {reminder_uuid} (ID).")
+
+        reminder = self.reminders.get(reminder_uuid)
+
+        if not reminder:
+            self.log.warning(f"Reminder {reminder_uuid} (ID) not found! Skipping...")
+            return
 
         channel = self.bot.get_channel(reminder["channel_id"])
 
@@ -243,11 +302,10 @@ class ReminderCog(LogSubclass, commands.Cog):
             self.log.exception(f"Failed to send reminder {reminder_uuid} (ID).")
 
         self.reminders.pop(reminder_uuid, None)
-        self.tasks.pop(reminder_uuid, None)
+        self._by_user.get(reminder["user_id"], set()).discard(reminder_uuid)
+        self._dirty.set()
 
-        self.log.debug(f"Reminder {reminder_uuid} (ID) removed from memory and tasks.")
-        SimpleUtils.save_data(Config.REMINDERS_DATA_PATH, list(self.reminders.values()))
-        self.log.info(f"Reminders data saved after sending reminder {reminder_uuid} (ID).")
+        self.log.debug(f"Reminder {reminder_uuid} (ID) removed from memory. Flush pending.")
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -7,7 +7,6 @@ from discord import Interaction, Message, TextChannel, app_commands
 from discord.ext import commands
 
 from chii.config import Config
-from chii.main import video_worker
 from chii.utils import T_DATA, LogSubclass, SimpleUtils
 
 
@@ -18,6 +17,10 @@ class RepostCog(LogSubclass, commands.Cog):
         self.bot = bot
         self.url_regex = re.compile(pattern=Config.REPOSTS_URL_REGEX, flags=re.IGNORECASE)
 
+        # on_message runs for every message bot-wide; keep the watched
+        # channels in memory so the hot path never touches the disk.
+        self._channel_ids: set[int] = set(self._load_data()["channel_ids"])
+
         self.log.info("RepostCog initialized.")
 
     def _load_data(self) -> T_DATA:
@@ -47,20 +50,22 @@ class RepostCog(LogSubclass, commands.Cog):
         if message.author.bot:
             return
 
+        # Cheap literal pre-screen; most messages carry no URL at all.
+        # Lowercased to match the regex's IGNORECASE behaviour.
+        if "http" not in message.content.lower():
+            return
+
         match = self.url_regex.search(message.content)
 
         if not match:
             return
 
-        data = self._load_data()
-        channel_ids = data.get("channel_ids", [])
-
-        if message.channel.id not in channel_ids:
+        if message.channel.id not in self._channel_ids:
             return
 
         self.log.info(f"Detected repost URL in channel {message.channel.id} by user {message.author.id}.")
 
-        await video_worker.enqueue({
+        await self.bot.video_worker.enqueue({
             "message": message,
             "url": match.group(1),
         })
@@ -73,16 +78,14 @@ class RepostCog(LogSubclass, commands.Cog):
     async def repost_add(self: t.Self, interaction: Interaction, channel: TextChannel) -> None:
         self.log.info(f"Received repost add command for channel {channel.id}.")
 
-        data = self._load_data()
-
-        if channel.id in data["channel_ids"]:
+        if channel.id in self._channel_ids:
             self.log.info(f"Channel {channel.id} is already being watched for reposts.")
             await interaction.response.send_message("Channel is already being watched.", ephemeral=True)
             return
 
-        data["channel_ids"].append(channel.id)
+        self._channel_ids.add(channel.id)
 
-        SimpleUtils.save_data(Config.REPOSTS_DATA_PATH, data)
+        await SimpleUtils.asave_data(Config.REPOSTS_DATA_PATH, {"channel_ids": list(self._channel_ids)})
         self.log.info(f"Channel {channel.id} added to repost watch list and data saved.")
 
         await interaction.response.send_message(f"Added {channel.mention} as repost channel.", ephemeral=True)
@@ -93,16 +96,14 @@ class RepostCog(LogSubclass, commands.Cog):
     async def repost_remove(self: t.Self, interaction: Interaction, channel: TextChannel) -> None:
         self.log.info(f"Received repost remove command for channel {channel.id}.")
 
-        data = self._load_data()
-
-        if channel.id not in data["channel_ids"]:
+        if channel.id not in self._channel_ids:
             self.log.info(f"Channel {channel.id} is not currently being watched for reposts.")
             await interaction.response.send_message("Channel not watched.", ephemeral=True)
             return
 
-        data["channel_ids"].remove(channel.id)
+        self._channel_ids.discard(channel.id)
 
-        SimpleUtils.save_data(Config.REPOSTS_DATA_PATH, data)
+        await SimpleUtils.asave_data(Config.REPOSTS_DATA_PATH, {"channel_ids": list(self._channel_ids)})
         self.log.info(f"Channel {channel.id} removed from repost watch list and data saved.")
 
         await interaction.response.send_message(f"Removed {channel.mention} from the watching list.", ephemeral=True)
@@ -112,8 +113,7 @@ class RepostCog(LogSubclass, commands.Cog):
     async def repost_list(self: t.Self, interaction: Interaction) -> None:
         self.log.info("Received repost list command.")
 
-        data = self._load_data()
-        channel_ids = data["channel_ids"]
+        channel_ids = self._channel_ids
 
         if not channel_ids:
             self.log.info("No channels are currently being watched for reposts.")
@@ -1,6 +1,7 @@
 import json
 import os
 import pathlib
+import sys
 
 import dotenv
 
@@ -13,7 +14,9 @@ class Config:
     COGS_PATH = _ROOT_PATH / "cogs"
     DATA_PATH = _ROOT_PATH / "data"
     LOGS_PATH = DATA_PATH / "logs"
-    TEMP_PATH = DATA_PATH / "temp"
+    # Prefer tmpfs on Linux: video temp files never touch the disk, and
+    # leftovers vanish on reboot. The outputs stay well under its size.
+    TEMP_PATH = pathlib.Path("/dev/shm/chii_temp") if sys.platform == "linux" and pathlib.Path("/dev/shm").exists() else DATA_PATH / "temp"
 
     ANILIST_DATA_PATH = DATA_PATH / "anilist.json"
     REMINDERS_DATA_PATH = DATA_PATH / "reminders.json"
@@ -24,6 +27,9 @@ class Config:
     BOT_OWNER = int(os.getenv("BOT_OWNER", "0"))
     BOT_MANAGERS = json.loads(os.getenv("BOT_MANAGERS", "[]"))
 
+    # Shortens background loop intervals. Never changes which code runs.
+    DEBUG = os.getenv("DEBUG", "0") == "1"
+
     ANILIST_NORMAL_UPDATES_TIME_SEC = float(10 * 60)
     ANILIST_DEBUG_UPDATES_TIME_SEC = float(10)
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import pathlib
 
@@ -15,7 +16,6 @@ intents = Intents.default()
 intents.message_content = True
 
 bot = commands.Bot(owner_id=Config.BOT_OWNER, command_prefix=Config.BOT_PREFIX, intents=intents)
-video_worker = VideoWorker(bot=bot, worker_count=3, max_queue_size=5)
 
 
 @bot.event
@@ -30,7 +30,10 @@ async def on_ready() -> None:
 
 
 async def load_cogs() -> None:
-    for file in pathlib.Path("chii/cogs").rglob("*.py"):
+    # The directory scan is blocking I/O; keep it off the event loop.
+    files = await asyncio.to_thread(lambda: list(pathlib.Path("chii/cogs").rglob("*.py")))
+
+    for file in files:
         if file.name == "__init__.py":
             continue
 
@@ -42,10 +45,14 @@ async def start() -> None:
     log.info("Starting bot main loop...")
 
     async with bot:
+        # Built here so the worker's queue binds to the running loop
+        # instead of being created at import time.
+        bot.video_worker = VideoWorker(bot=bot, worker_count=3, max_queue_size=5)
+
         await load_cogs()
         log.info("Cogs loaded.")
 
-        video_worker.start()
+        bot.video_worker.start()
 
         await bot.start(Config.BOT_TOKEN, reconnect=True)
         log.info("Bot started.")
@@ -1,6 +1,7 @@
 import logging
+import queue
 import typing as t
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from chii.config import Config
 
@@ -15,6 +16,10 @@ class LogSubclass:
 class LogHandler:
     l = logging.getLogger(f"chii.utils.{__qualname__}")
 
+    # Kept on the class so the listener threads are not garbage collected.
+    _main_listener: QueueListener | None = None
+    _discord_listener: QueueListener | None = None
+
     @classmethod
     def setup(cls) -> None:
         Config.LOGS_PATH.mkdir(parents=True, exist_ok=True)
@@ -34,8 +39,15 @@ class LogHandler:
 
         main_handler.setFormatter(formatter)
 
+        # Loggers only drop records onto a queue; a background listener
+        # thread does the formatting and file writes, so the event loop
+        # never blocks on the handler lock or disk I/O.
+        main_queue: queue.Queue = queue.Queue(-1)
+        cls._main_listener = QueueListener(main_queue, main_handler)
+        cls._main_listener.start()
+
         root_logger.setLevel(logging.DEBUG)
-        root_logger.addHandler(main_handler)
+        root_logger.addHandler(QueueHandler(main_queue))
 
         discord_handler = RotatingFileHandler(
             filename=Config.LOGS_PATH / "discord.log",
@@ -46,9 +58,14 @@ class LogHandler:
 
         discord_handler.setFormatter(formatter)
 
+        # Separate queue so discord records never route into "chii.log".
+        discord_queue: queue.Queue = queue.Queue(-1)
+        cls._discord_listener = QueueListener(discord_queue, discord_handler)
+        cls._discord_listener.start()
+
         discord_logger = logging.getLogger("discord")
         discord_logger.setLevel(logging.INFO)
-        discord_logger.addHandler(discord_handler)
+        discord_logger.addHandler(QueueHandler(discord_queue))
 
         # Prevent discord logs appearing in "chii.log".
         discord_logger.propagate = False
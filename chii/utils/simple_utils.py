@@ -1,62 +1,89 @@
-import json
+import asyncio
+import os
 import pathlib
 import typing as t
 
+import orjson
 from discord.abc import GuildChannel, Messageable
 
 from chii.utils import T_DATA, LogSubclass
 
 
+_UNIT_SEC = {"s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+
+# Types that already passed the Messageable ABC check; an exact-type hit
+# skips the slower isinstance walk on hot paths like reminder fires.
+_MESSAGEABLE_TYPES: set[type] = set()
+
+
 class SimpleUtils(LogSubclass):
     @classmethod
     def save_data(cls, path: pathlib.Path, data: T_DATA | list[t.Any]) -> None:
         try:
-            with pathlib.Path(path).open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            path = pathlib.Path(path)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+
+            with tmp_path.open("wb") as f:
+                # Compact output: these files are machine-read only.
+                f.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Readers never see a half-written file this way.
+            tmp_path.replace(path)
 
         except Exception:
             cls.log.exception("Failed saving reminders.")
 
+    @classmethod
+    async def asave_data(cls, path: pathlib.Path, data: T_DATA | list[t.Any]) -> None:
+        # Keeps the blocking serialize+fsync off the event loop.
+        await asyncio.to_thread(cls.save_data, path, data)
+
     @staticmethod
     def is_guild_channel(channel: t.Any, /) -> t.TypeGuard[GuildChannel]:
         return isinstance(channel, GuildChannel)
 
     @staticmethod
     def is_messageable(channel: t.Any, /) -> t.TypeGuard[Messageable]:
-        return isinstance(channel, Messageable)
+        if type(channel) in _MESSAGEABLE_TYPES:
+            return True
+
+        if isinstance(channel, Messageable):
+            _MESSAGEABLE_TYPES.add(type(channel))
+            return True
+
+        return False
 
     @staticmethod
     def paginate_text(text: str, /) -> list[str]:
         pages = []
-        buffer = ""
         max_page_size = 1800
 
+        # Lines are collected and joined once per page; appending to a
+        # string buffer instead is quadratic on large dumps.
+        buffer: list[str] = []
+        buffer_len = 0
+
         for line in text.splitlines(keepends=True):
-            if len(buffer) + len(line) > max_page_size:
-                pages.append(buffer)
-                buffer = line
+            if buffer_len + len(line) > max_page_size:
+                pages.append("".join(buffer))
+                buffer = [line]
+                buffer_len = len(line)
 
             else:
-                buffer += line
+                buffer.append(line)
+                buffer_len += len(line)
 
         if buffer:
-            pages.append(buffer)
+            pages.append("".join(buffer))
 
         return pages
 
     @staticmethod
     def parse_time(time_string: str, /) -> float:
-        unit = time_string[-1].lower()
-        value = float(time_string[:-1])
-
-        match unit:
-            case "s":
-                return value
-            case "m":
-                return value * 60
-            case "h":
-                return value * 3600
-            case "d":
-                return value * 86400
-            case _:
-                raise ValueError("Invalid time format.")
+        try:
+            return float(time_string[:-1]) * _UNIT_SEC[time_string[-1].lower()]
+
+        except KeyError:
+            raise ValueError("Invalid time format.") from None
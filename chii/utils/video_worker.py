@@ -1,6 +1,8 @@
 import asyncio
+import contextlib
+import os
 import pathlib
-import subprocess
+import time
 import typing as t
 import uuid
 
@@ -9,7 +11,7 @@ from discord import File, Message
 from discord.ext import commands
 
 from chii.config import Config
-from chii.utils import T_NUMERIC, LogSubclass
+from chii.utils import T_DATA, LogSubclass
 
 
 class _YTDLogger:
@@ -27,207 +29,354 @@ class _VideoJob(t.TypedDict):
     message: Message
     url: str
 
+    # Metadata fetched at enqueue time; the worker downloads from it
+    # instead of re-extracting.
+    info: t.NotRequired[T_DATA | None]
+
+
+# Trending links get reposted across channels within minutes; keep the
+# finished output around briefly so repeats skip the whole pipeline.
+_URL_CACHE_TTL_SEC = 300.0
+
+_REPOST_TEMPLATE = "{user_text}\n\n-# Sent: **@{username}** ({nick})\n-# Source: **<{url}>**"
+
 
 class VideoWorker(LogSubclass):
     def __init__(self: t.Self, bot: commands.Bot, worker_count: int, max_queue_size: int) -> None:
         self.bot = bot
 
-        self.queue = asyncio.Queue(max_queue_size)
+        # Priority-ordered by estimated duration: short clips jump ahead
+        # of long encodes instead of queueing behind them.
+        self.queue: asyncio.PriorityQueue[tuple[float, float, _VideoJob]] = asyncio.PriorityQueue(max_queue_size)
         self.worker_count = worker_count
-        self.active_urls = set()
-        self.tasks = []
+
+        # Splitting the cores between workers stops N concurrent encodes
+        # from spawning N x nproc x264 threads and thrashing each other.
+        self.threads_per_job = max(1, (os.cpu_count() or 1) // worker_count)
+
+        # URL -> worker task (None while the job is still queued). Doubles
+        # as the dedupe set and lets stop() account for in-flight jobs.
+        self.active_jobs: dict[str, asyncio.Task | None] = {}
+        self._url_cache: dict[str, tuple[pathlib.Path, float]] = {}
+        self._supervisor: asyncio.Task | None = None
+
+        # One reused downloader per worker; building a YoutubeDL spins up
+        # the whole extractor registry, which is too costly to do per job.
+        self._ydl_pool: list[yt_dlp.YoutubeDL] = []
+
+        # A single reused instance for enqueue-time metadata probes; the
+        # lock serializes it since YoutubeDL is not thread-safe.
+        self._probe_ydl: yt_dlp.YoutubeDL | None = None
+        self._probe_lock = asyncio.Lock()
+
+        # Resolved from "ffmpeg -encoders" on the first compression.
+        self._encoder: str | None = None
 
         self.log.info(f"VideoWorker initialized with {worker_count} workers and a max queue size of {max_queue_size}.")
 
     def start(self) -> None:
         self.log.info("Starting video worker threads...")
 
-        for i in range(self.worker_count):
-            self.tasks.append(asyncio.create_task(self._worker_loop(i)))
+        options = {
+            # Prioritize low quality for uploads.
+            "format": "mp4/bestvideo[height<=480]+bestaudio/best[height<=480]",
+            "quiet": True,
+            "noplaylist": True,
+            "cookiefile": None,
+            "logger": _YTDLogger(),
+        }
 
+        self._ydl_pool = [yt_dlp.YoutubeDL(options) for _ in range(self.worker_count)]
+        self._probe_ydl = yt_dlp.YoutubeDL(options)
+
+        self._supervisor = asyncio.create_task(self._run_workers())
         self.log.info(f"Started {self.worker_count} video workers.")
 
+    async def _run_workers(self) -> None:
+        # The TaskGroup owns the worker tasks: cancelling the supervisor
+        # tears all of them down without leaving orphans behind.
+        async with asyncio.TaskGroup() as tg:
+            for i in range(self.worker_count):
+                tg.create_task(self._worker_loop(i))
+
     async def stop(self) -> None:
         self.log.info("Stopping all video worker tasks...")
 
-        for task in self.tasks:
-            task.cancel()
+        if self._supervisor:
+            self._supervisor.cancel()
+
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._supervisor
+
+        # A cancellation mid-job skips the worker's finally-based cleanup;
+        # drop whatever is left so a restart starts from a clean slate.
+        self.active_jobs.clear()
 
-        await asyncio.gather(*self.tasks, return_exceptions=True)
         self.log.info("All video worker tasks stopped.")
 
     async def enqueue(self: t.Self, job: _VideoJob) -> None:
         url = job["url"]
 
-        if url in self.active_urls:
-            self.log.info(f'The URL "{url}" is already in queue. Skipping...')
+        if url in self.active_jobs:
+            self.log.info('The URL "%s" is already in queue. Skipping...', url)
             return
 
-        if self.queue.full():
+        self.active_jobs[url] = None
+
+        async with self._probe_lock:
+            info = await asyncio.to_thread(self._probe_info, url)
+
+        job["info"] = info
+        estimated = float(info.get("duration") or float("inf")) if info else float("inf")
+
+        try:
+            # The monotonic tiebreaker keeps equal estimates FIFO and stops
+            # the heap from ever comparing the job dicts. A full queue drops
+            # the job instead of blocking the listener.
+            self.queue.put_nowait((estimated, time.monotonic(), job))
+
+        except asyncio.QueueFull:
+            self.active_jobs.pop(url, None)
             self.log.warning("Queue is full! Skipping job...")
             return
 
-        self.active_urls.add(url)
-        self.log.info(f'Enqueued job for URL "{url}". Queue size is now {self.queue.qsize()}.')
+        self.log.info('Enqueued job for URL "%s" (estimated %ss). Queue size is now %s.', url, estimated, self.queue.qsize())
 
-        await self.queue.put(job)
+    def _probe_info(self: t.Self, url: str) -> T_DATA | None:
+        try:
+            return self._probe_ydl.extract_info(url, download=False)
 
-    def _download_video(self: t.Self, url: str) -> pathlib.Path | None:
-        self.log.info(f'Starting download for video URL "{url}"...')
+        except Exception:
+            self.log.debug('Could not probe metadata for URL "%s".', url)
+            return None
+
+    def _download_video(self: t.Self, url: str, worker_id: int, info: T_DATA | None) -> tuple[pathlib.Path, float] | None:
+        self.log.info('Starting download for video URL "%s"...', url)
 
         Config.TEMP_PATH.mkdir(parents=True, exist_ok=True)
 
         filename = f"{uuid.uuid4()}.mp4"
         output = Config.TEMP_PATH / filename
 
-        options = {
-            # Has to be a string since yt-dlp works with os module.
-            "outtmpl": str(output),
-            # Prioritize low quality for uploads.
-            "format": "mp4/bestvideo[height<=480]+bestaudio/best[height<=480]",
-            "quiet": True,
-            "noplaylist": True,
-            "cookiefile": None,
-            "logger": _YTDLogger(),
-        }
+        # Workers run one job at a time, so each can safely retarget and
+        # reuse its own downloader instance.
+        ydl = self._ydl_pool[worker_id]
+
+        # Has to be a string since yt-dlp works with os module.
+        ydl.params["outtmpl"] = {"default": str(output)}
 
         try:
-            with yt_dlp.YoutubeDL(**options) as yt:
-                yt.download([url])
+            # yt-dlp already knows the duration; taking it from the info
+            # dict saves an ffprobe spawn and container re-parse per job.
+            if info:
+                # Metadata was already extracted at enqueue time; download
+                # from it instead of hitting the site's extractor again.
+                info = ydl.process_ie_result(info, download=True)
+
+            else:
+                info = ydl.extract_info(url, download=True)
 
-            self.log.info(f'Downloaded video from "{url}" to "{output}".')
+            self.log.info('Downloaded video from "%s" to "%s".', url, output)
 
         except Exception:
-            self.log.exception(f'Failed to download video from "{url}"!')
+            self.log.exception('Failed to download video from "%s"!', url)
             return None
 
         if not output.exists():
-            self.log.error(f'Download completed but output file "{output}" does not exist.')
+            self.log.error('Download completed but output file "%s" does not exist.', output)
             return None
 
-        return output
-
-    def _get_duration(self: t.Self, path: pathlib.Path) -> float:
-        self.log.debug(f"Getting duration for file {path}...")
-
-        # fmt: off
-        command = [
-            "ffprobe",
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            path,
-        ]
-        # fmt: on
+        return output, float(info.get("duration") or 0)
 
-        result = subprocess.run(command, capture_output=True, text=True)
-
-        try:
-            duration = float(result.stdout.strip())
-            self.log.info(f'Got duration {duration}s for file "{path}".')
-
-        except Exception:
-            self.log.exception(f'Failed to get duration for "{path}"!')
-            raise
-
-        else:
-            return duration
-
-    async def _worker_loop(self: t.Self, worker_id: T_NUMERIC) -> None:
-        self.log.info(f"[Video Worker {worker_id}]: Ready.")
+    async def _worker_loop(self: t.Self, worker_id: int) -> None:
+        self.log.info("[Video Worker %s]: Ready.", worker_id)
 
         while True:
-            job = await self.queue.get()
+            _, _, job = await self.queue.get()
 
-            self.log.debug(f'[Video Worker {worker_id}]: Picked up job for URL {job["url"]} from queue.')
+            self.active_jobs[job["url"]] = asyncio.current_task()
+            self.log.debug("[Video Worker %s]: Picked up job for URL %s from queue.", worker_id, job["url"])
 
             try:
                 await self._process_job(job, worker_id)
             except Exception:
-                self.log.exception(f"[Video Worker {worker_id}]: Unexpected exception while processinrg job!")
+                self.log.exception("[Video Worker %s]: Unexpected exception while processing job!", worker_id)
             finally:
-                self.active_urls.discard(job["url"])
-                self.log.debug(f'[Video Worker {worker_id}]: Job for URL {job["url"]} completed and removed from queue.')
+                self.active_jobs.pop(job["url"], None)
+                self.log.debug("[Video Worker %s]: Job for URL %s completed and removed from queue.", worker_id, job["url"])
                 self.queue.task_done()
 
-    async def _process_job(self: t.Self, job: _VideoJob, worker_id: T_NUMERIC) -> None:
+    async def _process_job(self: t.Self, job: _VideoJob, worker_id: int) -> None:
         message = job["message"]
         url = job["url"]
 
-        self.log.info(f'[Video Worker {worker_id}]: Processing job for URL "{url}"...')
+        self.log.info('[Video Worker %s]: Processing job for URL "%s"...', worker_id, url)
+
+        cached = self._url_cache.get(url)
+
+        if cached and time.monotonic() - cached[1] < _URL_CACHE_TTL_SEC and cached[0].exists():
+            self.log.info('[Video Worker %s]: Reusing cached output for URL "%s".', worker_id, url)
+            compressed = cached[0]
+
+        else:
+            async with message.channel.typing():
+                loop = asyncio.get_running_loop()
+
+                downloaded = await loop.run_in_executor(None, self._download_video, url, worker_id, job.get("info"))
+
+                if not downloaded:
+                    self.log.error('[Video Worker %s]: Failed to download video from URL "%s".', worker_id, url)
+                    return
 
-        async with message.channel.typing():
-            loop = asyncio.get_running_loop()
+                video, duration = downloaded
 
-            video = await loop.run_in_executor(None, self._download_video, url)
+                max_bytes = Config.REPOSTS_MAX_SIZE_MB * 1024 * 1024
 
-            if not video:
-                self.log.error(f'[Video Worker {worker_id}]: Failed to download video from URL "{url}".')
-                return
+                if video.stat().st_size <= max_bytes:
+                    # The 480p-capped download often fits already; skipping the
+                    # encode is the biggest possible saving for short clips.
+                    self.log.info("[Video Worker %s]: Downloaded file already fits the size limit. Skipping compression.", worker_id)
+                    compressed = video
 
-            compressed = await loop.run_in_executor(None, self._compress_to_limit, video)
+                else:
+                    compressed = await self._compress_to_limit(video, duration)
 
-            video.unlink(missing_ok=True)
-            self.log.info(f"[Video Worker {worker_id}]: Removed original video file {video}.")
+                    video.unlink(missing_ok=True)
+                    self.log.info("[Video Worker %s]: Removed original video file %s.", worker_id, video)
 
-            if not compressed:
-                self.log.error(f'[Video Worker {worker_id}]: Failed to compress video from URL "{url}".')
-                return
+                    if not compressed:
+                        self.log.error('[Video Worker %s]: Failed to compress video from URL "%s".', worker_id, url)
+                        return
+
+            self._url_cache[url] = (compressed, time.monotonic())
 
         user_text = message.content.replace(url, "").strip()
-        member = message.guild.get_member(message.author.id) if message.guild else None
-        nick = member.nick if member and member.nick else message.author.display_name
+
+        # In a guild the author is already a Member; display_name resolves
+        # nick-or-name itself, no member-cache probe needed.
+        nick = message.author.display_name
         username = message.author.name
 
-        repost_text = f"{user_text}\n\n-# Sent: **@{username}** ({nick})\n-# Source: **<{url}>**"
+        repost_text = _REPOST_TEMPLATE.format(user_text=user_text, username=username, nick=nick, url=url)
 
         try:
             await message.delete()
-            self.log.info(f"[Video Worker {worker_id}]: Deleted original message from user {message.author.id}.")
+            self.log.info("[Video Worker %s]: Deleted original message from user %s.", worker_id, message.author.id)
 
         except Exception:
-            self.log.exception(f"[Video Worker {worker_id}]: Could not delete message!")
+            self.log.exception("[Video Worker %s]: Could not delete message!", worker_id)
 
         await message.channel.send(repost_text, file=File(compressed))
-        self.log.info(f"[Video Worker {worker_id}]: Sent reposted video to channel {message.channel.id}.")
+        self.log.info("[Video Worker %s]: Sent reposted video to channel %s.", worker_id, message.channel.id)
+
+        # Outputs stay on disk until their cache entry expires so URL
+        # repeats can skip the pipeline entirely.
+        self._prune_url_cache()
+
+    def _prune_url_cache(self) -> None:
+        now = time.monotonic()
+
+        for url, (path, stored_at) in list(self._url_cache.items()):
+            if now - stored_at >= _URL_CACHE_TTL_SEC:
+                path.unlink(missing_ok=True)
+                del self._url_cache[url]
+                self.log.debug('Expired cached output for URL "%s".', url)
+
+    async def _detect_encoder(self) -> str:
+        if self._encoder is not None:
+            return self._encoder
+
+        encoder = "libx264"
+
+        # An encoder being compiled into ffmpeg says nothing about the
+        # hardware underneath it; actually encode one test frame so a
+        # GPU-less host falls through to libx264 instead of failing
+        # every compression for the life of the process.
+        for candidate in ("h264_nvenc", "h264_videotoolbox"):
+            # fmt: off
+            command = [
+                "ffmpeg", "-hide_banner",
+                "-f", "lavfi", "-i", "color=black:s=64x64:d=0.1",
+                "-frames:v", "1",
+                "-c:v", candidate,
+                "-f", "null", "-",
+            ]
+            # fmt: on
+
+            try:
+                process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+                returncode = await process.wait()
+
+            except Exception:
+                self.log.exception('Could not probe the "%s" encoder!', candidate)
+                continue
+
+            if returncode == 0:
+                encoder = candidate
+                break
 
-        compressed.unlink(missing_ok=True)
-        self.log.info(f"[Video Worker {worker_id}]: Removed compressed video file {compressed}.")
+            self.log.debug('The "%s" encoder failed the test encode.', candidate)
 
-    def _compress_to_limit(self: t.Self, input_file: pathlib.Path) -> pathlib.Path | None:
-        self.log.info(f'Starting compression for input file "{input_file}"...')
+        self._encoder = encoder
+        self.log.info('Using "%s" as the video encoder.', self._encoder)
+
+        return self._encoder
+
+    async def _compress_to_limit(self: t.Self, input_file: pathlib.Path, duration: float) -> pathlib.Path | None:
+        self.log.info('Starting compression for input file "%s"...', input_file)
+
+        if duration <= 0:
+            self.log.error('No duration known for "%s". Cannot derive a target bitrate!', input_file)
+            return None
 
-        duration = self._get_duration(input_file)
         max_bytes = Config.REPOSTS_MAX_SIZE_MB * 1024 * 1024
         bitrate = int(((max_bytes * 8) / duration) / 1000)
 
         output = Config.TEMP_PATH / f"{uuid.uuid4()}_compressed.mp4"
+        encoder = await self._detect_encoder()
 
         # fmt: off
+        if encoder == "h264_nvenc":
+            codec_args = ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "28"]
+
+        elif encoder == "h264_videotoolbox":
+            codec_args = ["-c:v", "h264_videotoolbox", "-b:v", f"{bitrate}k"]
+
+        else:
+            # Reposts are throwaway clips; encode speed beats coding
+            # efficiency, and CRF with a VBV cap spends bits where needed
+            # instead of tracking a constant bitrate on every frame.
+            codec_args = ["-c:v", "libx264", "-preset", "ultrafast", "-tune", "fastdecode", "-crf", "28"]
+
         command = [
             "ffmpeg",
             "-y",
             "-i", input_file,
-            "-c:v", "libx264",
-            "-preset", "veryfast",
-            "-b:v", f"{bitrate}k",
+            *codec_args,
+            "-threads", str(self.threads_per_job),
             "-maxrate", f"{bitrate}k",
-            "-bufsize", f"{bitrate}k",
+            "-bufsize", f"{2 * bitrate}k",
             "-c:a", "aac",
+            # Puts the moov atom up front so playback starts before the download finishes.
+            "-movflags", "+faststart",
             output,
         ]
         # fmt: on
 
-        self.log.info(f'Compressing input file "{input_file}" to "{output}" with bitrate {bitrate}k...')
-        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.log.info('Compressing input file "%s" to "%s" with bitrate %sk...', input_file, output, bitrate)
+
+        # An async subprocess lets the event loop watch the child directly
+        # instead of parking an executor thread on subprocess.run.
+        process = await asyncio.create_subprocess_exec(*command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        await process.wait()
 
         if not output.exists():
-            self.log.error(f'Compression failed. The "{output}" file was not created.')
+            self.log.error('Compression failed. The "%s" file was not created.', output)
             return None
 
         if output.stat().st_size > max_bytes + (1 * 1024 * 1024):
-            self.log.error(f'Compressed file "{output}" exceeds maximum size of {max_bytes} bytes.')
+            self.log.error('Compressed file "%s" exceeds maximum size of %s bytes.', output, max_bytes)
             return None
 
-        self.log.info(f'Compressed video saved to "{output}".')
+        self.log.info('Compressed video saved to "%s".', output)
         return output